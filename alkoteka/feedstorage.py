@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Final
+
+import scrapy
+from scrapy.extensions.feedexport import FileFeedStorage
+
+# Exporters write each item as its own small write(); a big buffer turns
+# those into a few large writes to disk.
+_WRITE_BUFFER_SIZE: Final[int] = 4 * 1024 * 1024
+
+
+class BufferedFileFeedStorage(FileFeedStorage):
+    """
+    Local file feed storage with a 4 MiB write buffer.
+
+    Same behaviour as Scrapy's FileFeedStorage (used for `-O result.json`),
+    only the output file is opened with a larger buffer. The buffer is
+    flushed when the feed is closed at the end of the crawl.
+    """
+
+    def open(self, spider: scrapy.Spider) -> IO[bytes]:
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open(self.write_mode, buffering=_WRITE_BUFFER_SIZE)
@@ -1,16 +1,21 @@
-import scrapy
+from dataclasses import dataclass
+from typing import Any
 
 
-class ProductItem(scrapy.Item):
-    timestamp = scrapy.Field()
-    RPC = scrapy.Field()
-    url = scrapy.Field()
-    title = scrapy.Field()
-    marketing_tags = scrapy.Field()
-    brand = scrapy.Field()
-    section = scrapy.Field()
-    price_data = scrapy.Field()
-    stock = scrapy.Field()
-    assets = scrapy.Field()
-    metadata = scrapy.Field()
-    variants = scrapy.Field()
+# A slotted dataclass instead of scrapy.Item: no per-field validation on
+# assignment and no backing dict per item. Scrapy's feed exporters handle
+# dataclass items natively through itemadapter.
+@dataclass(slots=True)
+class ProductItem:
+    timestamp: int
+    RPC: str
+    url: str
+    title: str
+    marketing_tags: list[str]
+    brand: str
+    section: list[str]
+    price_data: dict[str, Any]
+    stock: dict[str, Any]
+    assets: dict[str, Any]
+    metadata: dict[str, Any]
+    variants: int
@@ -12,7 +12,13 @@ USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
-DOWNLOAD_DELAY = 1.0
+# No fixed DOWNLOAD_DELAY: it caps the whole crawl at ~1 req/s. Let
+# AutoThrottle adapt to the JSON API's latency and back off on its own.
+AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_START_DELAY = 0.25
+AUTOTHROTTLE_TARGET_CONCURRENCY = 8.0
+CONCURRENT_REQUESTS = 32
+CONCURRENT_REQUESTS_PER_DOMAIN = 16
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -22,3 +28,9 @@ DEFAULT_REQUEST_HEADERS = {
 DOWNLOADER_MIDDLEWARES = {
     "alkoteka.middlewares.ProxyMiddleware": 350,
 }
+
+# Buffer local feed output (`-O result.json`) instead of many tiny writes
+FEED_STORAGES = {
+    "": "alkoteka.feedstorage.BufferedFileFeedStorage",
+    "file": "alkoteka.feedstorage.BufferedFileFeedStorage",
+}
@@ -1,15 +1,65 @@
-import configparser
+import functools
 import json
+import logging
+import sys
 import time
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Final, cast
 
 import scrapy
 import scrapy.http
 
 from alkoteka.items import ProductItem
 
+CONFIG_FILE = "config.ini"
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_ini(text: str) -> dict[str, dict[str, str]]:
+    """
+    Minimal INI reader for our flat config.ini: '[section]' headers and
+    'key = value' or 'key: value' lines, '#'/';' comments. Keys are
+    lower-cased like configparser does; anything outside a section is
+    ignored, and lines without a delimiter are skipped with a warning.
+    """
+    config: dict[str, dict[str, str]] = {}
+    section: dict[str, str] | None = None
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            section = config.setdefault(line[1:-1].strip(), {})
+            continue
+        if section is None:
+            continue
+        # Like configparser, split on whichever of '=' / ':' comes first
+        # (so 'base_url = https://...' keeps its colon in the value)
+        split_at = min(
+            (i for i in (line.find("="), line.find(":")) if i != -1), default=-1
+        )
+        if split_at == -1:
+            logger.warning("Ignoring config line without '=' or ':': %r", line)
+            continue
+        key, value = line[:split_at], line[split_at + 1 :]
+        section[key.strip().lower()] = value.strip()
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(filename: str = CONFIG_FILE) -> dict[str, dict[str, str]]:
+    """
+    Parse config.ini once and keep it as plain dicts; the file doesn't change
+    during a crawl, so later lookups are just dict access. A missing file
+    gives an empty config and the usual defaults apply.
+    """
+    path = Path(filename)
+    if not path.exists():
+        return {}
+    return _parse_ini(path.read_text(encoding="utf-8"))
+
 
 class AlkotekaSpider(scrapy.Spider):
     name = "alkoteka"
@@ -18,6 +68,51 @@ class AlkotekaSpider(scrapy.Spider):
     # API Endpoints
     API_LIST_URL = "https://alkoteka.com/api/v1/product"
     API_DETAIL_URL = "https://alkoteka.com/api/v1/product/{uuid}"
+    _LIST_URL_TMPL: Final[str] = (
+        API_LIST_URL + "?city_uuid={c}&root_category_slug={s}&page={p}&per_page=20"
+    )
+
+    # List-endpoint fields that must all be present to build an item without
+    # fetching the detail endpoint (see _has_full_list_data)
+    _LIST_ITEM_FIELDS: Final[tuple[str, ...]] = (
+        "vendor_code",
+        "slug",
+        "name",
+        "volume",
+        "price",
+        "image_url",
+        "quantity_total",
+    )
+    # Keys that may legitimately be empty/false but must be present, so a
+    # missing discount, brand or tag isn't mistaken for "none"
+    _LIST_ITEM_KEYS: Final[tuple[str, ...]] = (
+        "brand",
+        "prev_price",
+        "is_new",
+        "is_gift",
+        "properties",
+    )
+    # At least one of these must be non-empty to fill __description
+    _LIST_DESCRIPTION_FIELDS: Final[tuple[str, ...]] = (
+        "description",
+        "description_blocks",
+    )
+
+    # Top-level product fields copied into metadata when present
+    _KNOWN_SPECS: Final[tuple[str, ...]] = (
+        "country",
+        "region",
+        "strength",
+        "sugar",
+        "grape",
+        "color",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Product UUIDs already emitted or requested: the same product can be
+        # listed under several categories, with different list URLs.
+        self._seen_uuids: set[str] = set()
 
     def start_requests(self) -> Generator[scrapy.Request, None, None]:
         """
@@ -25,17 +120,17 @@ class AlkotekaSpider(scrapy.Spider):
         load categories from file and fire the first list API requests.
         """
         # --- Configuration Loading ---
-        config = configparser.ConfigParser()
-        config.read("config.ini")
+        config = _load_config()
+        spider_cfg = config.get("spider", {})
 
         # 1. City Handling
         # Priority: CLI arg > Config 'default_city' > 'krasnodar'
         cli_city = getattr(self, "city", None)
-        config_city = config.get("spider", "default_city", fallback="krasnodar")
+        config_city = spider_cfg.get("default_city", "krasnodar")
         target_city_key = cli_city or config_city
 
         # Fetch UUID from [cities] section
-        city_uuid = config.get("cities", target_city_key.lower(), fallback=None)
+        city_uuid = config.get("cities", {}).get(target_city_key.lower())
 
         if not city_uuid:
             self.logger.error(
@@ -51,7 +146,7 @@ class AlkotekaSpider(scrapy.Spider):
         cat_filename = getattr(
             self,
             "categories",
-            config.get("spider", "categories_file", fallback="categories.txt"),
+            spider_cfg.get("categories_file", "categories.txt"),
         )
         cat_file = Path(cat_filename)
 
@@ -61,6 +156,12 @@ class AlkotekaSpider(scrapy.Spider):
 
         content = cat_file.read_text(encoding="utf-8")
 
+        # Max items limit (default 100 items per category)
+        # Convert items to pages (20 items per page)
+        max_items = int(getattr(self, "max_items", 100))
+        # Equivalent to ceil(max_items / 20) without importing math
+        max_pages = (max_items + 19) // 20
+
         for raw_line in content.splitlines():
             line = raw_line.strip()
             if not line:
@@ -75,16 +176,7 @@ class AlkotekaSpider(scrapy.Spider):
                 continue
 
             # Construct List API Request
-            url = (
-                f"{self.API_LIST_URL}?city_uuid={city_uuid}"
-                f"&root_category_slug={slug}&page=1&per_page=20"
-            )
-
-            # Max items limit (default 100 items per category)
-            # Convert items to pages (20 items per page)
-            max_items = int(getattr(self, "max_items", 100))
-            # Equivalent to ceil(max_items / 20) without importing math
-            max_pages = (max_items + 19) // 20
+            url = self._LIST_URL_TMPL.format(c=city_uuid, s=slug, p=1)
 
             # mypy's Request callback signature doesn't account for generator callbacks.
             # Scrapy supports them at runtime, so we ignore this arg-type here.
@@ -108,15 +200,14 @@ class AlkotekaSpider(scrapy.Spider):
 
     def parse(
         self, response: scrapy.http.Response, *args: object, **kwargs: object
-    ) -> Generator[scrapy.Request, None, None]:
+    ) -> Generator[scrapy.Request | ProductItem, None, None]:
         """
-        List endpoint handler: fan out detail requests for each product and
-        follow pagination while we still have pages and haven't hit max_pages.
+        List endpoint handler: emit items straight from list data when it is
+        complete, fan out detail requests for the rest, and follow pagination
+        while we still have pages and haven't hit max_pages.
         """
-        try:
-            data = json.loads(response.text)
-        except json.JSONDecodeError:
-            self.logger.error(f"Failed to decode JSON from {response.url}")
+        data = self._load_json(response)
+        if data is None:
             return
 
         if not data.get("success"):
@@ -137,8 +228,16 @@ class AlkotekaSpider(scrapy.Spider):
         city_uuid = response.meta["city_uuid"]
 
         for prod in products:
-            # Use UUID for detail request if available
             p_uuid = prod.get("uuid")
+            if p_uuid and not self._mark_seen(p_uuid):
+                continue
+
+            # Skip the detail round-trip when the list already has what we need
+            if self._has_full_list_data(prod):
+                yield self._build_item(prod, prod)
+                continue
+
+            # Use UUID for detail request if available
             if not p_uuid:
                 self.logger.warning("Product missing UUID, skipping detail fetch")
                 continue
@@ -189,13 +288,7 @@ class AlkotekaSpider(scrapy.Spider):
             next_page = current_page + 1
             root_slug = response.meta["slug"]
 
-            next_url = (
-                f"{self.API_LIST_URL}?"
-                f"city_uuid={city_uuid}&"
-                f"root_category_slug={root_slug}&"
-                f"page={next_page}&"
-                f"per_page=20"
-            )
+            next_url = self._LIST_URL_TMPL.format(c=city_uuid, s=root_slug, p=next_page)
 
             # Same callback-type mismatch explanation as above.
             yield scrapy.Request(
@@ -212,51 +305,138 @@ class AlkotekaSpider(scrapy.Spider):
     def parse_product(
         self, response: scrapy.http.Response
     ) -> Generator[ProductItem, None, None]:
-        """
-        Detail endpoint handler: take one product JSON blob and map it into
-        our ProductItem using small helpers so this method stays readable.
-        """
+        """Detail endpoint handler: map one product JSON blob into ProductItem."""
         product = self._get_product_data(response)
         if not product:
             return
 
-        list_data = response.meta.get("list_data", {})
-        slug = self._resolve_slug(product, list_data)
-
-        item = ProductItem()
-        item["timestamp"] = int(time.time())
-        item["RPC"] = str(product.get("vendor_code", "") or "")
-        item["url"] = f"https://alkoteka.com/product/{slug}"
-        item["brand"] = self._parse_brand(product)
-        item["title"] = self._parse_title(product)
-        item["section"] = self._parse_section(product)
-        item["price_data"] = self._parse_price_data(product)
-        item["stock"] = self._parse_stock(product)
-        item["assets"] = self._parse_assets(product)
-        item["metadata"] = self._parse_metadata(product)
-        item["marketing_tags"] = self._parse_marketing_tags(product)
-        item["variants"] = 0
-
-        yield item
+        yield self._build_item(product, response.meta.get("list_data", {}))
 
-    def _get_product_data(
-        self, response: scrapy.http.Response
-    ) -> dict[str, Any] | None:
+    def _build_item(
+        self, product: dict[str, Any], list_data: dict[str, Any]
+    ) -> ProductItem:
         """
-        Parse JSON and pull out the product dict from 'results', returning
-        None if the payload is not what we expect.
+        Map a product dict (detail or complete list entry) into ProductItem.
+
+        Simple fields are read once into locals and built inline; only the
+        multi-step blocks (section, price, metadata) keep their own helpers.
+        """
+        get = product.get
+
+        # Slug from detail JSON, falling back to what the list API gave us
+        slug = str(get("slug") or list_data.get("slug") or "")
+
+        brand = ""
+        brand_info = get("brand")
+        if isinstance(brand_info, dict):
+            brand_name = brand_info.get("name")
+            if isinstance(brand_name, str):
+                brand = brand_name
+
+        # Title: if volume is known but not in the name, append it like
+        # 'Name, 0.5 л' (rule from the test task).
+        name_raw = get("name")
+        name = str(name_raw).strip() if name_raw else ""
+        volume_raw = get("volume")
+        volume = str(volume_raw).strip() if volume_raw else ""
+        if name and volume and volume not in name:
+            title = f"{name}, {volume}"
+        else:
+            title = name or volume
+
+        # quantity_total may be int/float/str; anything unparsable becomes 0
+        count = 0
+        count_raw = get("quantity_total", 0)
+        if isinstance(count_raw, (int, float)):
+            count = int(count_raw)
+        elif isinstance(count_raw, str):
+            try:
+                count = int(count_raw)
+            except ValueError:
+                count = 0
+
+        # Only the main image is exposed; 360 and video stay empty
+        main_img_raw = get("image_url")
+        main_img = str(main_img_raw) if main_img_raw else ""
+
+        marketing_tags: list[str] = []
+        if get("is_new"):
+            marketing_tags.append("Новинка")
+        if get("is_gift"):
+            marketing_tags.append("Подарок")
+
+        return ProductItem(
+            timestamp=int(time.time()),
+            RPC=str(get("vendor_code", "") or ""),
+            url=f"https://alkoteka.com/product/{slug}",
+            title=title,
+            marketing_tags=marketing_tags,
+            brand=brand,
+            section=self._parse_section(get("category")),
+            price_data=self._parse_price_data(get("price"), get("prev_price")),
+            stock={"in_stock": count > 0, "count": count},
+            assets={
+                "main_image": main_img,
+                "set_images": [main_img] if main_img else [],
+                "view360": [],
+                "video": [],
+            },
+            metadata=self._parse_metadata(product),
+            variants=0,
+        )
+
+    def _mark_seen(self, p_uuid: str) -> bool:
+        """Remember a product UUID; False if it was already seen."""
+        if p_uuid in self._seen_uuids:
+            return False
+        self._seen_uuids.add(p_uuid)
+        return True
+
+    def _has_full_list_data(self, prod: dict[str, Any]) -> bool:
+        """
+        True when a list entry looks like a full product payload: required
+        fields non-empty, optional ones (brand, prev_price, tags, properties)
+        at least present, a non-empty category and a description. Optional
+        _KNOWN_SPECS keys can't be told apart from absent ones and are taken
+        as-is. Anything less falls back to the detail request.
+        """
+        if any(prod.get(k) in (None, "") for k in self._LIST_ITEM_FIELDS):
+            return False
+        if any(k not in prod for k in self._LIST_ITEM_KEYS):
+            return False
+        category = prod.get("category")
+        if not (isinstance(category, dict) and category):
+            return False
+        return any(prod.get(k) for k in self._LIST_DESCRIPTION_FIELDS)
+
+    def _load_json(self, response: scrapy.http.Response) -> dict[str, Any] | None:
+        """
+        Decode an API response straight from response.body. json.loads takes
+        UTF-8 bytes directly, so we skip Scrapy's encoding sniffing and the
+        full str copy that response.text would build.
         """
         try:
-            raw_data = json.loads(response.text)
-        except json.JSONDecodeError:
+            raw_data = json.loads(response.body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             self.logger.error("Failed to decode JSON from %s", response.url)
             return None
 
         if not isinstance(raw_data, dict):
-            self.logger.error("Unexpected product payload at %s", response.url)
+            self.logger.error("Unexpected JSON payload at %s", response.url)
             return None
 
-        data = cast(dict[str, Any], raw_data)
+        return cast(dict[str, Any], raw_data)
+
+    def _get_product_data(
+        self, response: scrapy.http.Response
+    ) -> dict[str, Any] | None:
+        """
+        Parse JSON and pull out the product dict from 'results', returning
+        None if the payload is not what we expect.
+        """
+        data = self._load_json(response)
+        if data is None:
+            return None
 
         if not data.get("success"):
             self.logger.error("Product API error at %s", response.url)
@@ -269,56 +449,36 @@ class AlkotekaSpider(scrapy.Spider):
 
         return cast(dict[str, Any], product)
 
-    def _resolve_slug(self, product: dict[str, Any], list_data: dict[str, Any]) -> str:
-        """Try to get slug from detail JSON, fall back to what list API gave us."""
-        slug = product.get("slug") or list_data.get("slug") or ""
-        return str(slug)
-
-    def _parse_brand(self, product: dict[str, Any]) -> str:
-        """Grab brand name if it exists, otherwise give back empty string."""
-        brand_info = product.get("brand")
-        if isinstance(brand_info, dict):
-            name = brand_info.get("name")
-            if isinstance(name, str):
-                return name
-        return ""
-
-    def _parse_title(self, product: dict[str, Any]) -> str:
-        """
-        Build title; if volume is shown on the product but not in the name,
-        append it like 'Name, 0.5 л' (rule from the test task).
-        """
-        name_raw = product.get("name")
-        name = str(name_raw).strip() if name_raw else ""
-        volume_raw = product.get("volume")
-        volume = str(volume_raw).strip() if volume_raw else ""
-        if volume and volume not in name and name:
-            return f"{name}, {volume}"
-        if name:
-            return name
-        return volume
-
-    def _parse_section(self, product: dict[str, Any]) -> list[str]:
+    def _parse_section(self, category: object) -> list[str]:
         """
         Build section/breadcrumb list by walking category parents from leaf
         to root.
         """
         section: list[str] = []
-        category = product.get("category")
         while isinstance(category, dict):
             name = category.get("name")
-            if isinstance(name, str):
-                section.insert(0, name)
+            if isinstance(name, str) and name:
+                section.append(name)
             category = category.get("parent")
-        return [part for part in section if part]
+        # Collected leaf -> root; breadcrumbs go root -> leaf
+        section.reverse()
+        return section
 
-    def _parse_price_data(self, product: dict[str, Any]) -> dict[str, Any]:
+    def _parse_price_data(self, price: object, prev_price: object) -> dict[str, Any]:
         """
         Build price_data with current/original and 'Скидка X%' when we clearly
         see that original > current.
         """
-        current = self._to_float(product.get("price"))
-        original = self._to_float(product.get("prev_price"))
+        # The API sends JSON numbers, so only fall back to string parsing
+        # for the odd non-numeric value.
+        if isinstance(price, (int, float)):
+            current = float(price)
+        else:
+            current = self._str_to_float(price)
+        if isinstance(prev_price, (int, float)):
+            original = float(prev_price)
+        else:
+            original = self._str_to_float(prev_price)
         if original == 0:
             original = current
 
@@ -329,37 +489,6 @@ class AlkotekaSpider(scrapy.Spider):
 
         return {"current": current, "original": original, "sale_tag": sale_tag}
 
-    def _parse_stock(self, product: dict[str, Any]) -> dict[str, Any]:
-        """
-        Turn whatever quantity_total we got (int/float/str) into a sane int
-        and mark in_stock if it's > 0; fall back to 0 on any garbage.
-        """
-        count = 0
-        count_raw = product.get("quantity_total", 0)
-        if isinstance(count_raw, (int, float)):
-            count = int(count_raw)
-        elif isinstance(count_raw, str):
-            try:
-                count = int(count_raw)
-            except ValueError:
-                count = 0
-        return {"in_stock": count > 0, "count": count}
-
-    def _parse_assets(self, product: dict[str, Any]) -> dict[str, Any]:
-        """
-        Map main image into the assets block; 360 and video are left empty
-        because the current API doesn't expose them.
-        """
-        main_img_raw = product.get("image_url")
-        main_img = str(main_img_raw) if main_img_raw else ""
-        set_images = [main_img] if main_img else []
-        return {
-            "main_image": main_img,
-            "set_images": set_images,
-            "view360": [],
-            "video": [],
-        }
-
     def _parse_metadata(self, product: dict[str, Any]) -> dict[str, Any]:
         """
         Fill metadata: description plus a couple of common fields (country,
@@ -375,8 +504,7 @@ class AlkotekaSpider(scrapy.Spider):
 
         metadata: dict[str, Any] = {"__description": desc_text}
 
-        known_specs = ["country", "region", "strength", "sugar", "grape", "color"]
-        for spec in known_specs:
+        for spec in self._KNOWN_SPECS:
             parsed = self._parse_spec_value(product.get(spec))
             if parsed:
                 metadata[spec] = parsed
@@ -386,19 +514,12 @@ class AlkotekaSpider(scrapy.Spider):
             for key, val in props.items():
                 parsed_prop = self._parse_spec_value(val)
                 if parsed_prop:
-                    metadata[key] = parsed_prop
+                    # The same few property keys repeat on every product;
+                    # interning lets all items share one string per key.
+                    metadata[sys.intern(key)] = parsed_prop
 
         return metadata
 
-    def _parse_marketing_tags(self, product: dict[str, Any]) -> list[str]:
-        """Turn simple boolean flags into human-readable marketing tags."""
-        tags = []
-        if product.get("is_new"):
-            tags.append("Новинка")
-        if product.get("is_gift"):
-            tags.append("Подарок")
-        return tags
-
     def _parse_spec_value(self, value: object) -> str:
         """Normalize one characteristic value into a plain string."""
         if isinstance(value, dict) and "name" in value:
@@ -407,10 +528,8 @@ class AlkotekaSpider(scrapy.Spider):
             return str(value)
         return ""
 
-    def _to_float(self, value: object) -> float:
-        """Best-effort conversion to float; anything weird becomes 0.0."""
-        if isinstance(value, (int, float)):
-            return float(value)
+    def _str_to_float(self, value: object) -> float:
+        """Slow path for non-numeric prices: parse strings, the rest is 0.0."""
         if isinstance(value, str):
             try:
                 return float(value)
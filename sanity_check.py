@@ -1,6 +1,129 @@
 import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import IO, Any, NoReturn
+
+# Read result.json in chunks this big instead of loading it whole
+CHUNK_SIZE = 64 * 1024
+# Characters of a token that may continue in the next chunk: digits and
+# number signs, letters of true/false/null/NaN/Infinity and hex digits of
+# a \uXXXX escape
+_PARTIAL_TOKEN_CHARS = "0123456789abcdefABCDEF+-.INilnrstuy"
+# Characters a JSON value can start with (json.loads also takes NaN/Infinity)
+_VALUE_START_CHARS = '{"-0123456789tfnNI'
+# Whitespace as JSON defines it; str.strip() would also eat other characters
+_JSON_WHITESPACE = " \t\n\r"
+
+
+class RootNotListError(ValueError):
+    """The JSON document is valid, but its root is not an array."""
+
+
+def _is_cut_off(buf: str, pos: int) -> bool:
+    """True if everything from pos to the end of buf may be an unfinished token."""
+    return not buf[pos:].strip(_PARTIAL_TOKEN_CHARS)
+
+
+def _decode_element(
+    decoder: json.JSONDecoder, fh: IO[str], buf: str
+) -> tuple[Any, str]:
+    """
+    Decode one element from the start of buf and return it with the rest.
+
+    More of fh is read only while the element may be cut at the chunk edge;
+    an error anywhere else is malformed input and is raised right away.
+    """
+    while True:
+        try:
+            value, end = decoder.raw_decode(buf)
+        except json.JSONDecodeError as err:
+            truncated = err.msg.startswith("Unterminated string")
+            if not (truncated or _is_cut_off(buf, err.pos)):
+                raise
+            chunk = fh.read(CHUNK_SIZE)
+            if not chunk:
+                raise
+            buf += chunk
+            continue
+
+        # A number at the chunk edge decodes early ("1" of "1.5"), so peek
+        # further before accepting it
+        if _is_cut_off(buf, end):
+            chunk = fh.read(CHUNK_SIZE)
+            if chunk:
+                buf += chunk
+                continue
+        return value, buf[end:]
+
+
+def _check_trailing(fh: IO[str], rest: str) -> None:
+    """Only whitespace may follow the closing bracket of the array."""
+    while not rest.strip(_JSON_WHITESPACE):
+        rest = fh.read(CHUNK_SIZE)
+        if not rest:
+            return
+    raise json.JSONDecodeError("Extra data", rest, 0)
+
+
+def _raise_for_non_list_root(
+    decoder: json.JSONDecoder, fh: IO[str], buf: str
+) -> NoReturn:
+    """
+    Report a root that isn't an array: RootNotListError if the document is
+    valid JSON, JSONDecodeError otherwise. This is only the error path, so
+    decoding the whole root value here is fine.
+    """
+    if buf[0] not in _VALUE_START_CHARS:
+        raise json.JSONDecodeError("Expecting value", buf, 0)
+    _, rest = _decode_element(decoder, fh, buf)
+    _check_trailing(fh, rest)
+    raise RootNotListError
+
+
+def iter_json_array(path: Path) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one by one.
+
+    Only the current chunk and the element being decoded are kept in memory,
+    so a large crawl output is never materialized as a whole list.
+    """
+    decoder = json.JSONDecoder()
+    with path.open(encoding="utf-8") as fh:
+        buf = ""
+        while not buf:
+            chunk = fh.read(CHUNK_SIZE)
+            if not chunk:
+                raise json.JSONDecodeError("Expecting value", "", 0)
+            buf = chunk.lstrip(_JSON_WHITESPACE)
+        if buf[0] != "[":
+            _raise_for_non_list_root(decoder, fh, buf)
+        buf = buf[1:]
+        # "start": right after '[', "item": after an element, "comma": after ','
+        state = "start"
+
+        while True:
+            buf = buf.lstrip(_JSON_WHITESPACE)
+            if not buf:
+                buf = fh.read(CHUNK_SIZE)
+                if not buf:
+                    raise json.JSONDecodeError("Unterminated array", "", 0)
+                continue
+
+            if buf[0] == "]" and state != "comma":
+                _check_trailing(fh, buf[1:])
+                return
+
+            if state == "item":
+                if buf[0] != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, 0)
+                buf = buf[1:]
+                state = "comma"
+                continue
+
+            value, buf = _decode_element(decoder, fh, buf)
+            yield value
+            state = "item"
 
 
 # This is a small CLI helper; keeping all checks
@@ -12,17 +135,22 @@ def sanity_check(file_path: str = "result.json") -> None:  # noqa: PLR0912
         print(f"❌ File '{file_path}' not found.")
         sys.exit(1)
 
+    # Stream the array: keep the first item for the schema checks and only
+    # count the rest, so memory doesn't grow with the size of the crawl.
+    item: Any = None
+    total = 0
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        print(f"❌ File '{file_path}' is not valid JSON.")
+        for element in iter_json_array(path):
+            if total == 0:
+                item = element
+            total += 1
+    except RootNotListError:
+        print("❌ JSON root is not a list.")
         sys.exit(1)
-
-    if not isinstance(data, list):
-        print(f"❌ JSON root is not a list (got {type(data).__name__}).")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        print(f"❌ File '{file_path}' is not valid JSON.")
         sys.exit(1)
 
-    total = len(data)
     print(f"✅ Loaded {total} items from '{file_path}'.")
 
     if total == 0:
@@ -30,7 +158,6 @@ def sanity_check(file_path: str = "result.json") -> None:  # noqa: PLR0912
         return
 
     # Schema Check (First Item)
-    item = data[0]
     required_keys = {
         "timestamp",
         "RPC",
@@ -0,0 +1,115 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import sanity_check
+from sanity_check import RootNotListError, iter_json_array
+
+# Small sizes put chunk edges inside every token; the last is the real one
+CHUNK_SIZES = [*range(1, 12), 64, sanity_check.CHUNK_SIZE]
+
+CASES = [
+    # valid arrays
+    "[]",
+    " [ ] \n",
+    "[1,2, 3]",
+    '[{"a":[1,2]},{"b":"x]"}, 12345678]',
+    '[ "é", 1.5e10 ]',
+    '[true,null,-0.25e-3,"a\\"b"]',
+    '["\\u00e9\\ud83d\\ude00", false, -1E+5]',
+    "[[[]],{}]",
+    "[1]  \n ",
+    '[1,2,{"x":"y"},null]  ',
+    "[NaN, Infinity, -Infinity, 1]",
+    # malformed arrays
+    "[1,]",
+    "[1 2]",
+    "[1]x",
+    "[1] ,",
+    "[1",
+    '["abc',
+    "[1x, 2]",
+    '[{"a": nope}, 1]',
+    "[ 1]",
+    # empty or not JSON at all
+    "",
+    "  ",
+    "garbage",
+    " []",
+    "tx",
+    # valid JSON with a non-array root
+    '{"a":1}',
+    "true",
+    ' "text" ',
+    "-12.5",
+    "NaN",
+]
+
+
+def _reference(text: str) -> Any:
+    """What iter_json_array should produce, derived from json.loads."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return json.JSONDecodeError
+    if not isinstance(data, list):
+        return RootNotListError
+    return data
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "result.json"
+
+    def _stream(self, text: str, chunk_size: int) -> Any:
+        self.path.write_text(text, encoding="utf-8")
+        with mock.patch.object(sanity_check, "CHUNK_SIZE", chunk_size):
+            try:
+                return list(iter_json_array(self.path))
+            except (json.JSONDecodeError, RootNotListError) as err:
+                return type(err)
+
+    def assertSameAsJsonLoads(self, text: str) -> None:
+        expected = _reference(text)
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(text=text, chunk_size=chunk_size):
+                result = self._stream(text, chunk_size)
+                # NaN != NaN, so compare the serialized form
+                self.assertEqual(
+                    json.dumps(result, default=repr), json.dumps(expected, default=repr)
+                )
+
+    def test_matches_json_loads(self) -> None:
+        for text in CASES:
+            self.assertSameAsJsonLoads(text)
+
+    def test_crawl_output(self) -> None:
+        item = {
+            "RPC": "123",
+            "title": "Вино, 0.75 л",
+            "price_data": {"current": 999.5, "original": 1200, "sale_tag": ""},
+            "metadata": {"__description": 'с "кавычками" и \\ слешем'},
+        }
+        self.assertSameAsJsonLoads(json.dumps([item] * 3, ensure_ascii=False))
+        self.assertSameAsJsonLoads(json.dumps([item] * 3, indent=2))
+
+    def test_malformed_element_fails_without_reading_to_eof(self) -> None:
+        good = json.dumps({"title": "x" * 100})
+        text = "[" + good + ', {"title" oops}, ' + ", ".join([good] * 2000)
+        # Invalid UTF-8 far past the bad element: reaching it would raise
+        # UnicodeDecodeError instead of reporting the bad element
+        self.path.write_bytes(text.encode("utf-8") + b"\xff]")
+        with (
+            mock.patch.object(sanity_check, "CHUNK_SIZE", 1024),
+            self.assertRaises(json.JSONDecodeError),
+        ):
+            list(iter_json_array(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()